@@ -2,8 +2,13 @@ import os
 import json
 import csv
 import random
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import tkinter as tk
 from tkinter import messagebox, ttk 
+from tkinter import font as tkfont
 # --- New Imports for Image Handling ---
 # NOTE: Pillow must be installed for image handling ('pip install Pillow')
 from PIL import Image, ImageTk 
@@ -15,14 +20,33 @@ import pygame
 from pygame import mixer
 # --- END IMPORTS ---
 
+# Parsed quiz data as (mtime, data), reused for as long as quiz_level.json's mtime is unchanged.
+# Always replaced as a whole so a background prefetch never exposes a half-updated entry.
+_quiz_cache = (None, None)
+
+def _read_quiz_file():
+    """Returns the parsed quiz_level.json, re-parsing only when its mtime changed. Raises on errors."""
+    global _quiz_cache
+    base_dir = os.path.dirname(__file__)
+    file_path = os.path.join(base_dir, "quiz_level.json")
+    mtime = os.stat(file_path).st_mtime_ns
+    cached_mtime, cached_data = _quiz_cache
+    if cached_mtime == mtime:
+        return cached_data
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    _quiz_cache = (mtime, data)
+    return data
+
 # Load quiz data from JSON
 def load_quiz_data():
-    """Loads quiz data from quiz_level.json in the script's directory."""
+    """
+    Loads quiz data from quiz_level.json in the script's directory.
+    Re-parses the file only when its modification time has changed.
+    """
     try:
-        base_dir = os.path.dirname(__file__)
-        file_path = os.path.join(base_dir, "quiz_level.json")
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_quiz_file()
 
     except FileNotFoundError:
         messagebox.showerror("Error", "Quiz data file not found! Please ensure quiz_level.json is in the same folder.")
@@ -31,10 +55,41 @@ def load_quiz_data():
         messagebox.showerror("Error", "Invalid JSON format in quiz_level.json.")
         return {}
 
-quiz_levels = load_quiz_data()
+def prefetch_quiz_data():
+    """Warms the quiz data cache from a worker thread; errors are reported later by load_quiz_data."""
+    try:
+        _read_quiz_file()
+    except (OSError, json.JSONDecodeError):
+        pass
+
+def get_level_questions(difficulty):
+    """Returns the question list for a difficulty from the cached quiz_level.json (prefetched at startup)."""
+    return load_quiz_data().get(difficulty, [])
 
 # Quiz App Class
 class QuizApp:
+    # Maximum number of resized PIL images kept in the resize cache
+    _MAX_RESIZE_CACHE = 32
+    # Delay (ms) used to coalesce bursts of <Configure> events during a drag
+    _RESIZE_DELAY_MS = 50
+    # Scale changes smaller than this are ignored to avoid sub-pixel churn
+    _MIN_SCALE_CHANGE = 0.02
+    # Mixer buffer size (samples). Small for responsive UI clicks; raise to 1024
+    # if playback stutters on slower machines (still far below the default).
+    CLICK_BUFFER = 512
+    # Buffered quiz results are written to the CSV once this many have accumulated
+    _RESULTS_FLUSH_THRESHOLD = 10
+    # Named ttk label styles and their base (size, weight), using the shared fonts
+    _LABEL_STYLES = {
+        "GameOver.TLabel": (30, "bold"),
+        "Title.TLabel": (24, "bold"),
+        "Greeting.TLabel": (22, "bold"),
+        "Message.TLabel": (18, "normal"),
+        "Subtitle.TLabel": (16, "normal"),
+        "Feedback.TLabel": (14, "bold"),
+        "Question.TLabel": (13, "normal"),
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("🐾 Cat Quiz Adventure 🐾")
@@ -46,6 +101,12 @@ class QuizApp:
         self.root.geometry(f"{self.base_width}x{self.base_height}")
         self.root.minsize(400, 300) 
         self.root.config(bg="#FFF4E0")
+        # Option-database defaults for the tk widgets built below, so the
+        # shared cream background and white button text aren't repeated per widget
+        self.root.option_add("*Frame.Background", "#FFF4E0")
+        self.root.option_add("*Label.Background", "#FFF4E0")
+        self.root.option_add("*Radiobutton.Background", "#FFF4E0")
+        self.root.option_add("*Button.Foreground", "white")
 
         # Make window responsive
         self.root.grid_rowconfigure(0, weight=1)
@@ -58,120 +119,255 @@ class QuizApp:
         self.selected_level = ""
         self.quiz_data = []
         self.scale = 1.0
+        self._screen = None # Active screen: "name", "difficulty", "quiz", "game_over" or "score"
+        self._pending_results = [] # Result rows not yet written to quiz_results.csv
+        # Single background worker so file I/O never stalls the UI (and stays ordered)
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        # Row batches the worker could not write, handed back for the next flush to retry
+        self._failed_results = queue.Queue()
+        # Results of background jobs, handed back to the Tk thread by _drain_background_results
+        self._results_q = queue.Queue()
+        self._pending_jobs = 0
+        self._resize_after = None # Pending after() token for the debounced rescale
+        # Shared named fonts keyed by base (family, size, weight). Resizing one
+        # updates every widget that uses it, so rescaling never touches widgets.
+        self._fonts = {}
+        self._fonts_scale = self.scale # Scale the shared fonts are currently sized for
+
+        # ttk styles shared by the text labels of every screen
+        self._style = ttk.Style(self.root)
+        for style_name, (size, weight) in self._LABEL_STYLES.items():
+            self._style.configure(style_name, background="#FFF4E0",
+                                  font=self.get_font("Comic Sans MS", size, weight))
         
         # Define volume level (0.3 = 30% volume)
         self.SOUND_VOLUME = 0.3 
 
         # --- Image Loading (Base objects) ---
-        self.base_images = {}
-        self.photo_images = {} # Stores resized PhotoImage objects for current scale
+        # Base PIL images (None if missing), set by load_base_images
+        self._cat_neutral = None
+        self._cat_sad = None
+        self._cat_excited = None
+        self._heart_full = None
+        self._heart_empty = None
+        self.resized_images = OrderedDict() # LRU cache of resized PIL images keyed by (id(base image), size)
         self.current_image_state = 'neutral' # Tracks cat state
+
+        # Persistent PhotoImages, repainted in place instead of reallocated
+        self._cat_photo = None
+        self._hearts_photo = None # Composite image of the whole hearts row
+        self._last_hearts_state = None # (lives, scale) the hearts row was last drawn for
         
         # Load all image assets (cat and hearts)
         self.load_base_images()
         # --- END Image Loading ---
         
-        # --- Pygame Mixer Initialization and Sound Loading ---
+        # --- Sound Setup (loaded in the background, see _load_sounds) ---
         self.correct_sound = None
         self.wrong_sound = None
         self.click_sound = None 
-        try:
-            pygame.mixer.init()
-            # Load sound files. Files must be named 'correct.wav', 'wrong.wav', 
-            # and 'click.wav' (for general interaction) and placed in the script's directory.
-            BASE_DIR = os.path.dirname(__file__)
-
-            self.correct_sound = mixer.Sound(os.path.join(BASE_DIR, "correct.wav"))
-            self.wrong_sound   = mixer.Sound(os.path.join(BASE_DIR, "wrong.wav"))
-            self.click_sound   = mixer.Sound(os.path.join(BASE_DIR, "click.wav"))
-
-            # Apply Volume Change
-            self.correct_sound.set_volume(self.SOUND_VOLUME)
-            self.wrong_sound.set_volume(self.SOUND_VOLUME)
-            self.click_sound.set_volume(self.SOUND_VOLUME) 
-
-            print("Sound mixer initialized and sounds loaded successfully.")
-        except pygame.error as e:
-            # If Pygame is not installed or sound files are missing, the app continues without sound.
-            print("-" * 50)
-            print(f"!!! WARNING: SOUND DISABLED !!!")
-            print(f"Ensure Pygame is installed ('pip install pygame') and that sound files are present.")
-            print(f"Pygame Error: {e}")
-            print("-" * 50)
         # --- END SOUND SETUP ---
 
         # Bind resize event for responsive design
         self.root.bind('<Configure>', self.on_resize)
 
+        # Write any buffered results before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self._flush_and_close)
+
+        # Screens built once and reused; clear_screen hides rather than destroys them
+        self._persistent_frames = []
+        self._build_name_screen_once()
+        self._build_difficulty_screen_once()
+        self._build_quiz_screen_once()
+        self._build_game_over_screen_once()
+        self._build_score_screen_once()
+
         self.name_screen()
 
+        # Load sounds and quiz data in the background so the first clicks never block
+        self.run_in_background(self._load_sounds, self._on_sounds_loaded)
+        self.run_in_background(prefetch_quiz_data)
+
     def load_base_images(self):
         """Loads the base Image objects using Pillow for cat icons and hearts."""
-        # Note: The state keys for cats are updated to include 'cat_' prefix for clarity.
+        # Each key names the attribute the image is stored on (prefixed with '_').
+        # Each entry is (filename, max bound in px). The bound comfortably exceeds the
+        # largest on-screen size (120 px cats, 25 px hearts) so later resizes stay sharp.
         image_files = {
-            'cat_neutral': "cat_neutral.png",
-            'cat_sad': "cat_sad.png",
-            'cat_excited': "cat_excited.png",
-            'heart_full': "heart_full.png",
-            'heart_empty': "heart_empty.png",
+            'cat_neutral': ("cat_neutral.png", 256),
+            'cat_sad': ("cat_sad.png", 256),
+            'cat_excited': ("cat_excited.png", 256),
+            'heart_full': ("heart_full.png", 64),
+            'heart_empty': ("heart_empty.png", 64),
         }
         
         base_dir = os.path.dirname(__file__)
 
-        for state, filename in image_files.items():
+        for state, (filename, max_bound) in image_files.items():
             file_path = os.path.join(base_dir, filename)
             try:
-                # Store the base PIL Image object
-                self.base_images[state] = Image.open(file_path)
+                # Downsample once to the bound so every later resize works on a small source.
+                # thumbnail() loads the pixel data, which also closes the underlying file.
+                img = Image.open(file_path)
+                img.thumbnail((max_bound, max_bound), Image.Resampling.LANCZOS)
+                # Convert to RGBA once so resizes never have to convert the mode again
+                setattr(self, f"_{state}", img.convert("RGBA"))
             except FileNotFoundError:
                 print(f"WARNING: Image file not found: {filename}. Using fallback text if applicable.")
-                self.base_images[state] = None 
+                setattr(self, f"_{state}", None)
             except Exception as e:
                 print(f"WARNING: Error loading image {filename}: {e}")
-                self.base_images[state] = None
+                setattr(self, f"_{state}", None)
 
-    def get_resized_image(self, state, base_target_size):
+    def get_resized_image(self, base_img, base_target_size):
         """
-        Resizes the base PIL Image for a given state and returns a Tkinter PhotoImage.
-        Caches the PhotoImage to prevent garbage collection.
+        Resizes a base PIL Image (e.g. self._cat_neutral) and returns the resized PIL Image.
+        Caches the result, evicting the least recently used sizes once
+        _MAX_RESIZE_CACHE is exceeded.
         """
-        base_img = self.base_images.get(state)
         if not base_img:
             return None
             
         target_size = int(base_target_size * self.scale)
         if target_size < 1:
             target_size = 1
+
+        # Base images live as long as the app, so their id() is a stable key
+        key = (id(base_img), target_size)
+        resized_img = self.resized_images.get(key)
+        if resized_img is not None:
+            self.resized_images.move_to_end(key)
+            return resized_img
             
-        # Resize using LANCZOS for quality
-        resized_img = base_img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+        # Resize using LANCZOS for quality on large icons; small icons (hearts)
+        # look the same with the much cheaper BILINEAR filter
+        if target_size >= 64:
+            resample = Image.Resampling.LANCZOS
+        else:
+            resample = Image.Resampling.BILINEAR
+        resized_img = base_img.resize((target_size, target_size), resample)
         
-        # Store and return the PhotoImage (using a unique key for caching)
-        key = f"{state}_{target_size}"
-        self.photo_images[key] = ImageTk.PhotoImage(resized_img)
-        return self.photo_images[key]
+        # Store and return the resized image, dropping the oldest entries
+        self.resized_images[key] = resized_img
+        while len(self.resized_images) > self._MAX_RESIZE_CACHE:
+            self.resized_images.popitem(last=False)
+        return resized_img
+
+    def paste_into_photo(self, photo, pil_img):
+        """
+        Repaints an existing PhotoImage with pil_img in place and returns it.
+        A new PhotoImage is only allocated when there is none yet or the size changed.
+        """
+        if photo is not None and (photo.width(), photo.height()) == pil_img.size:
+            photo.paste(pil_img)
+            return photo
+        return ImageTk.PhotoImage(pil_img)
         
     def set_cat_icon_image(self, state):
         """Sets the cat icon to the specified state (neutral/sad/excited)."""
-        # Map simplified state to full key and set base size
-        full_state = f'cat_{state}'
+        # Map simplified state to its base image and set base size
+        base_img = getattr(self, f'_cat_{state}')
         CAT_BASE_SIZE = 120 
+        # Remembered even while no cat is shown, so the next rescale draws it
+        self.current_image_state = state
         
         icon_widget = None
-        if hasattr(self, 'cat_icon') and self.cat_icon.winfo_exists():
+        if self._screen == "quiz":
             icon_widget = self.cat_icon
-        elif hasattr(self, 'menu_emoji') and self.menu_emoji.winfo_exists():
+        elif self._screen == "name":
             icon_widget = self.menu_emoji
 
         if icon_widget:
-            self.current_image_state = state
-            img = self.get_resized_image(full_state, CAT_BASE_SIZE)
+            img = self.get_resized_image(base_img, CAT_BASE_SIZE)
             if img:
-                icon_widget.config(image=img, text='')
-                icon_widget.image = img # Prevent garbage collection
+                self._cat_photo = self.paste_into_photo(self._cat_photo, img)
+                # Only rebind the label when it is not already showing our photo
+                if getattr(icon_widget, 'image', None) is not self._cat_photo:
+                    icon_widget.config(image=self._cat_photo, text='')
+                    icon_widget.image = self._cat_photo # Prevent garbage collection
             else:
                 # Fallback to text if image failed to load
-                icon_widget.config(image='', text="❓", font=("Arial", int(80 * self.scale)))
+                icon_widget.config(image='', text="❓", font=self.get_font("Arial", 80))
+
+    def run_in_background(self, func, on_done=None):
+        """Runs func on the I/O worker; on_done(result) is then called on the Tk thread.
+
+        If func raises, the traceback is printed and on_done receives None, so
+        every on_done must accept None.
+        """
+        def job():
+            result = None
+            try:
+                result = func()
+            except Exception:
+                # Nobody reads the Future, so report the failure here
+                traceback.print_exc()
+            finally:
+                # Always report back, so the drain loop stops even if func raised
+                self._results_q.put((on_done, result))
+
+        self._io_executor.submit(job)
+        self._pending_jobs += 1
+        if self._pending_jobs == 1:
+            self.root.after(16, self._drain_background_results)
+
+    def _drain_background_results(self):
+        """Delivers finished background results; polls only while jobs are pending."""
+        while True:
+            try:
+                on_done, result = self._results_q.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_jobs -= 1
+            if on_done:
+                # A failing callback must not stop the polling for later results
+                try:
+                    on_done(result)
+                except Exception:
+                    traceback.print_exc()
+
+        if self._pending_jobs > 0:
+            self.root.after(16, self._drain_background_results)
+
+    def _load_sounds(self):
+        """Initializes the mixer and returns the (correct, wrong, click) sounds, or None (I/O thread)."""
+        try:
+            # Smaller buffer than the default to cut click-to-sound latency
+            pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=self.CLICK_BUFFER)
+            pygame.mixer.init()
+            # Load sound files. Files must be named 'correct.wav', 'wrong.wav', 
+            # and 'click.wav' (for general interaction) and placed in the script's directory.
+            BASE_DIR = os.path.dirname(__file__)
+
+            sounds = (
+                mixer.Sound(os.path.join(BASE_DIR, "correct.wav")),
+                mixer.Sound(os.path.join(BASE_DIR, "wrong.wav")),
+                mixer.Sound(os.path.join(BASE_DIR, "click.wav")),
+            )
+
+            for sound in sounds:
+                # Silent warm-up play so the first real playback doesn't stall
+                sound.set_volume(0)
+                sound.play()
+                sound.stop()
+                # Apply Volume Change
+                sound.set_volume(self.SOUND_VOLUME)
+
+            print("Sound mixer initialized and sounds loaded successfully.")
+            return sounds
+        except (pygame.error, OSError) as e:
+            # If Pygame is not installed or sound files are missing, the app continues without sound.
+            print("-" * 50)
+            print(f"!!! WARNING: SOUND DISABLED !!!")
+            print(f"Ensure Pygame is installed ('pip install pygame') and that sound files are present.")
+            print(f"Error: {e}")
+            print("-" * 50)
+            return None
+
+    def _on_sounds_loaded(self, sounds):
+        """Installs the sounds loaded by _load_sounds (Tk thread)."""
+        if sounds:
+            self.correct_sound, self.wrong_sound, self.click_sound = sounds
 
     def play_click_sound(self):
         """Plays the click sound if it is loaded."""
@@ -185,114 +381,150 @@ class QuizApp:
             scale_w = event.width / self.base_width
             scale_h = event.height / self.base_height
             
-            # Use a slightly buffered minimum scale
-            self.scale = min(scale_w, scale_h) * 0.85
-            
-            # Ensure a minimum readable size
-            self.scale = max(self.scale, 0.4)
-            
-            self.update_ui_scaling()
+            # Use a slightly buffered minimum scale, with a minimum readable size
+            new_scale = max(min(scale_w, scale_h) * 0.85, 0.4)
+
+            # Skip sub-pixel changes relative to the last accepted scale
+            if abs(new_scale - self.scale) < self._MIN_SCALE_CHANGE:
+                return
+            self.scale = new_scale
+
+            # Debounce: only the last event in a burst triggers the rescale
+            if self._resize_after:
+                self.root.after_cancel(self._resize_after)
+            self._resize_after = self.root.after(self._RESIZE_DELAY_MS, self._apply_resize)
+
+    def _apply_resize(self):
+        """Runs the debounced rescale scheduled by on_resize."""
+        self._resize_after = None
+        self.update_ui_scaling()
 
     def get_font(self, family, size, weight="normal"):
-        """Helper to return a scaled font tuple."""
-        return (family, int(size * self.scale), weight)
+        """Helper to return the shared Font for a base font spec, sized for the current scale."""
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(root=self.root, family=family, size=int(size * self._fonts_scale), weight=weight)
+            self._fonts[key] = font
+        return font
+
+    def update_fonts(self):
+        """Resizes every shared Font once for the current scale."""
+        if self._fonts_scale == self.scale:
+            return
+        self._fonts_scale = self.scale
+        for (family, size, weight), font in self._fonts.items():
+            font.configure(size=int(size * self.scale))
 
     def update_ui_scaling(self):
-        """Updates the font size and element lengths across all screens."""
-        
-        # 1. MENU SCREEN
-        if hasattr(self, 'menu_emoji') and self.menu_emoji.winfo_exists():
-            # Update Cat Image (re-size the current one, which should be neutral)
-            self.set_cat_icon_image('neutral')
-
-            self.menu_title.config(font=self.get_font("Comic Sans MS", 24, "bold"))
-            self.name_entry.config(font=self.get_font("Comic Sans MS", 14))
-            self.start_btn.config(font=self.get_font("Comic Sans MS", 14, "bold"))
-
-        # 2. DIFFICULTY SCREEN
-        if hasattr(self, 'diff_title') and self.diff_title.winfo_exists():
-            self.diff_greeting.config(font=self.get_font("Comic Sans MS", 22, "bold"))
-            self.diff_title.config(font=self.get_font("Comic Sans MS", 16))
-            for btn in self.diff_buttons:
-                btn.config(font=self.get_font("Comic Sans MS", 14, "bold"))
-            
-            if hasattr(self, 'diff_back_btn') and self.diff_back_btn.winfo_exists():
-                self.diff_back_btn.config(font=self.get_font("Comic Sans MS", 12, "bold"))
-                # Update Place coordinates
-                scaled_x = int(20 * self.scale)
-                scaled_y = int(20 * self.scale)
-                self.diff_back_btn.place(x=scaled_x, y=scaled_y)
-
-
-        # 3. QUIZ SCREEN
-        if hasattr(self, 'question_label') and self.question_label.winfo_exists():
-            # Update Progress Bar length
-            new_len = int(600 * self.scale)
-            self.progress.config(length=new_len)
-            
-            # Update Cat Image (re-size the current one based on state)
-            self.set_cat_icon_image(self.current_image_state)
+        """Updates the font size and element lengths for the active screen."""
+        # This applies the current scale, so a pending debounced rescale is redundant
+        if self._resize_after:
+            self.root.after_cancel(self._resize_after)
+            self._resize_after = None
+
+        self.update_fonts()
+        # Screens that only use the shared fonts have no _rescale_ method
+        rescale = getattr(self, f"_rescale_{self._screen}", None)
+        if rescale:
+            rescale()
+
+    def _rescale_name(self):
+        """1. MENU SCREEN"""
+        # Update Cat Image (re-size the current one, which should be neutral)
+        self.set_cat_icon_image('neutral')
 
-            # Update Hearts by regenerating them with resized images
-            self.update_hearts()
+    def _rescale_difficulty(self):
+        """2. DIFFICULTY SCREEN"""
+        # Update Back Button Place coordinates
+        scaled_x = int(20 * self.scale)
+        scaled_y = int(20 * self.scale)
+        self.diff_back_btn.place(x=scaled_x, y=scaled_y)
+
+    def _rescale_quiz(self):
+        """3. QUIZ SCREEN"""
+        # Update Progress Bar length
+        new_len = int(600 * self.scale)
+        self.progress.config(length=new_len)
+        
+        # Update Cat Image (re-size the current one based on state)
+        self.set_cat_icon_image(self.current_image_state)
 
-            # Update Question
-            self.question_label.config(
-                font=self.get_font("Comic Sans MS", 13),
-                wraplength=int(700 * self.scale)
-            )
+        # Update Hearts by regenerating them with resized images
+        self.update_hearts()
 
-            # Update Options
-            for rb in self.option_buttons:
-                rb.config(font=self.get_font("Comic Sans MS", 14))
+        # Update Question wrapping
+        self.question_label.config(wraplength=int(700 * self.scale))
 
-            # Update Controls
-            self.feedback_label.config(font=self.get_font("Comic Sans MS", 14, "bold"))
-            self.hint_btn.config(font=self.get_font("Comic Sans MS", 12, "bold"))
-            self.next_btn.config(font=self.get_font("Comic Sans MS", 14, "bold"))
-            
-            # Update the Quiz Back Button (Change Level)
-            if hasattr(self, 'quiz_back_btn') and self.quiz_back_btn.winfo_exists():
-                self.quiz_back_btn.config(
-                    font=self.get_font("Comic Sans MS", 10, "bold")
-                )
-                # Update Place coordinates (lowered Y as requested)
-                scaled_x = int(20 * self.scale)
-                scaled_y = int(50 * self.scale) # Lowered
-                self.quiz_back_btn.place(x=scaled_x, y=scaled_y)
-
-
-        # 4. GAME OVER SCREEN
-        if hasattr(self, 'go_title') and self.go_title.winfo_exists():
-            self.go_title.config(font=self.get_font("Comic Sans MS", 30, "bold"))
-            self.go_msg.config(font=self.get_font("Comic Sans MS", 18))
-            self.go_btn.config(font=self.get_font("Comic Sans MS", 16, "bold"))
-
-        # 5. SCORE SCREEN
-        if hasattr(self, 'score_title') and self.score_title.winfo_exists():
-            self.score_title.config(font=self.get_font("Comic Sans MS", 24, "bold"))
-            self.score_val.config(font=self.get_font("Comic Sans MS", 18))
-            self.score_msg.config(font=self.get_font("Comic Sans MS", 16))
-            self.score_btn.config(font=self.get_font("Comic Sans MS", 14, "bold"))
-            self.retry_btn.config(font=self.get_font("Comic Sans MS", 14, "bold"))
+        # Update the Quiz Back Button (Change Level) Place coordinates (lowered Y as requested)
+        scaled_x = int(20 * self.scale)
+        scaled_y = int(50 * self.scale) # Lowered
+        self.quiz_back_btn.place(x=scaled_x, y=scaled_y)
 
     def save_result_to_csv(self):
-        """Appends the current quiz result to a CSV file."""
+        """Buffers the current quiz result; rows are written by flush_results."""
         if not self.user_name or not self.selected_level or len(self.quiz_data) == 0:
             return
 
+        self._pending_results.append((self.user_name, self.selected_level, self.score, len(self.quiz_data)))
+
+        # Safety net so a crash never loses more than a handful of results
+        if len(self._pending_results) >= self._RESULTS_FLUSH_THRESHOLD:
+            self.flush_results()
+
+    def flush_results(self):
+        """Hands all buffered quiz results, plus any that failed to write earlier, to the background writer."""
+        rows = self._take_results()
+        if rows:
+            # The worker gets its own list, so it never touches shared state
+            self._io_executor.submit(self._write_results, rows)
+
+    def _take_results(self):
+        """Removes and returns every result row still to be written, oldest first."""
+        rows = []
+        while True:
+            try:
+                rows.extend(self._failed_results.get_nowait())
+            except queue.Empty:
+                break
+        rows.extend(self._pending_results)
+        self._pending_results = []
+        return rows
+
+    def _write_results(self, rows):
+        """Appends result rows to the CSV file in a single write (runs on the I/O thread).
+
+        Rows that cannot be written go on _failed_results for the next flush to retry.
+        """
         base_dir = os.path.dirname(__file__)
         file_path = os.path.join(base_dir, "quiz_results.csv")
 
         file_exists = os.path.isfile(file_path)
 
-        with open(file_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
+        try:
+            with open(file_path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
 
-            if not file_exists:
-                writer.writerow(["Name", "Difficulty", "Score", "Total Items"])
+                if not file_exists:
+                    writer.writerow(["Name", "Difficulty", "Score", "Total Items"])
 
-            writer.writerow([self.user_name, self.selected_level, self.score, len(self.quiz_data)])
+                writer.writerows(rows)
+        except OSError as e:
+            # e.g. the file is open in Excel on Windows, or the disk is full
+            print(f"WARNING: Could not save {len(rows)} quiz result(s) to {file_path}: {e}")
+            self._failed_results.put(rows)
+
+    def _flush_and_close(self):
+        """Waits for pending writes, writes what is left on this thread, then closes the window.
+
+        Rows that still cannot be written are lost on exit; only the warning remains.
+        """
+        # Let queued writes finish first, so any that failed are retried below
+        self._io_executor.shutdown(wait=True)
+        rows = self._take_results()
+        if rows:
+            self._write_results(rows)
+        self.root.destroy()
 
     def reset_quiz(self):
         """Resets all quiz state variables."""
@@ -303,135 +535,152 @@ class QuizApp:
         self.quiz_data = []
 
     def clear_screen(self):
-        """Removes all widgets from the main window."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        """Hides every screen; screens are built once and reused, never destroyed."""
+        for frame in self._persistent_frames:
+            frame.grid_remove()
+
+    def _show_screen(self, name, frame):
+        """Makes name the active screen, rescales it and shows frame in place of the current screen."""
+        self._screen = name
+        self.clear_screen()
+        self.update_ui_scaling()
+
+        # Show the screen only once it is up to date, so it is laid out in a single pass
+        frame.grid(row=0, column=0, sticky="nsew")
 
     def update_hearts(self):
-        """Renders the heart icons (images) based on current lives."""
+        """Renders the heart icons as a single composite image based on current lives."""
         HEART_BASE_SIZE = 25 # Base size for heart image
+        HEART_GAP = 2 # Horizontal spacing between hearts in the strip
         
-        if not hasattr(self, 'hearts_frame') or not self.hearts_frame.winfo_exists():
+        if self._screen != "quiz":
             return
 
-        # Clear existing hearts
-        for widget in self.hearts_frame.winfo_children():
-            widget.destroy()
+        # Nothing to redraw if neither the lives nor the scale changed
+        state = (self.lives, self.scale)
+        if state == self._last_hearts_state:
+            return
+        self._last_hearts_state = state
 
         # Pre-load the resized images for the current scale
-        heart_full_img = self.get_resized_image('heart_full', HEART_BASE_SIZE)
-        heart_empty_img = self.get_resized_image('heart_empty', HEART_BASE_SIZE)
-
-        # Fallback text if images are missing
-        heart_font = ("Arial", int(17 * self.scale))
-        
-        for i in range(10):
-            is_alive = i < self.lives
-            icon = heart_full_img if is_alive else heart_empty_img
-            
-            if icon:
-                # Use image
-                heart = tk.Label(self.hearts_frame, image=icon, bg="#FFF4E0")
-                heart.image = icon # Prevent garbage collection
-            else:
-                # Fallback to text
-                heart_text = "❤️" if is_alive else "🤍"
-                heart = tk.Label(self.hearts_frame, text=heart_text, font=heart_font, bg="#FFF4E0")
-
-            heart.pack(side="left", padx=1, pady=2)
-            
-    def name_screen(self):
-        """Displays the initial screen for entering the user's name."""
-        # Only save results if a quiz was attempted (non-empty data)
-        if self.quiz_data:
-            self.save_result_to_csv()
+        heart_full_img = self.get_resized_image(self._heart_full, HEART_BASE_SIZE)
+        heart_empty_img = self.get_resized_image(self._heart_empty, HEART_BASE_SIZE)
+
+        if heart_full_img and heart_empty_img:
+            # Paste all 10 hearts into one strip and show it through one persistent photo
+            size = heart_full_img.width
+            slot = size + HEART_GAP
+            strip = Image.new("RGBA", (10 * slot, size))
+            for i in range(10):
+                icon = heart_full_img if i < self.lives else heart_empty_img
+                strip.paste(icon, (i * slot + HEART_GAP // 2, 0))
+
+            self._hearts_photo = self.paste_into_photo(self._hearts_photo, strip)
+            if getattr(self.hearts_label, 'image', None) is not self._hearts_photo:
+                self.hearts_label.config(image=self._hearts_photo, text='')
+                self.hearts_label.image = self._hearts_photo # Prevent garbage collection
+        else:
+            # Fallback to text if images are missing
+            heart_text = "❤️" * self.lives + "🤍" * (10 - self.lives)
+            self.hearts_label.config(image='', text=heart_text, font=self.get_font("Arial", 17))
+            self.hearts_label.image = None
             
-        self.clear_screen()
-        # Ensure only name is reset for a fresh start, keep existing self.user_name if returning from a game
+    def _build_name_screen_once(self):
+        """Builds the name screen widgets once; name_screen only refreshes them."""
+        self.name_frame = tk.Frame(self.root)
+        self._persistent_frames.append(self.name_frame)
 
-        frame = tk.Frame(self.root, bg="#FFF4E0")
-        frame.grid(row=0, column=0, sticky="nsew")
-
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_rowconfigure(1, weight=0)
-        frame.grid_rowconfigure(2, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
+        self.name_frame.grid_rowconfigure(0, weight=1)
+        self.name_frame.grid_rowconfigure(1, weight=0)
+        self.name_frame.grid_rowconfigure(2, weight=1)
+        self.name_frame.grid_columnconfigure(0, weight=1)
 
-        content_frame = tk.Frame(frame, bg="#FFF4E0")
+        content_frame = tk.Frame(self.name_frame)
         content_frame.grid(row=1, column=0)
 
         # Configured to hold the image
-        self.menu_emoji = tk.Label(content_frame, bg="#FFF4E0") 
+        self.menu_emoji = tk.Label(content_frame) 
         self.menu_emoji.grid(row=0, column=0, pady=10)
-        self.set_cat_icon_image('neutral') # Set initial image
 
-        
-        self.menu_title = tk.Label(content_frame, text="Welcome to Cat Quiz Adventure!", font=("Comic Sans MS", 24, "bold"), bg="#FFF4E0")
+        self.menu_title = ttk.Label(content_frame, text="Welcome to Cat Quiz Adventure!", style="Title.TLabel")
         self.menu_title.grid(row=1, column=0, pady=10)
 
-        self.name_entry = tk.Entry(content_frame, font=("Comic Sans MS", 14))
-        # Pre-fill if a name was previously entered
-        if self.user_name:
-            self.name_entry.insert(0, self.user_name)
-            
+        self.name_entry = tk.Entry(content_frame, font=self.get_font("Comic Sans MS", 14))
         self.name_entry.grid(row=2, column=0, pady=10, ipadx=50)
 
-        self.start_btn = tk.Button(content_frame, text="Start Quiz 🐾", font=("Comic Sans MS", 14, "bold"),
-                                     bg="#FF7BA9", fg="white", activebackground="#E86491",
+        self.start_btn = tk.Button(content_frame, text="Start Quiz 🐾", font=self.get_font("Comic Sans MS", 14, "bold"),
+                                     bg="#FF7BA9", activebackground="#E86491",
                                      relief="raised", bd=4, width=15, command=self.go_to_difficulty)
         self.start_btn.grid(row=3, column=0, pady=30)
-        
-        self.update_ui_scaling()
 
-    def go_to_difficulty(self):
-        """Displays the screen for selecting quiz difficulty."""
-        
-        # Check if we are coming from the name screen (entry exists) or back from quiz (entry destroyed)
-        if hasattr(self, 'name_entry') and self.name_entry.winfo_exists():
-            name = self.name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("Input Error", "Please enter your name.")
-                return
-            self.user_name = name
+    def name_screen(self):
+        """Displays the initial screen for entering the user's name."""
+        # Only save results if a quiz was attempted (non-empty data)
+        if self.quiz_data:
+            self.save_result_to_csv()
+            
+        # Ensure only name is reset for a fresh start, keep existing self.user_name if returning from a game
+
+        self.set_cat_icon_image('neutral') # Set initial image
+
+        # Pre-fill if a name was previously entered
+        self.name_entry.delete(0, "end")
+        if self.user_name:
+            self.name_entry.insert(0, self.user_name)
         
-        self.play_click_sound() # Play click sound
-        self.clear_screen()
+        self._show_screen("name", self.name_frame)
 
-        frame = tk.Frame(self.root, bg="#FFF4E0")
-        frame.grid(row=0, column=0, sticky="nsew")
+    def _build_difficulty_screen_once(self):
+        """Builds the difficulty screen widgets once; go_to_difficulty only refreshes them."""
+        self.difficulty_frame = tk.Frame(self.root)
+        self._persistent_frames.append(self.difficulty_frame)
 
         # Configure rows/columns for centering main content
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_rowconfigure(1, weight=0)
-        frame.grid_rowconfigure(2, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
+        self.difficulty_frame.grid_rowconfigure(0, weight=1)
+        self.difficulty_frame.grid_rowconfigure(1, weight=0)
+        self.difficulty_frame.grid_rowconfigure(2, weight=1)
+        self.difficulty_frame.grid_columnconfigure(0, weight=1)
 
-        content_frame = tk.Frame(frame, bg="#FFF4E0")
+        content_frame = tk.Frame(self.difficulty_frame)
         content_frame.grid(row=1, column=0)
 
         # Back Button (To Name Screen)
         # Using PLACE instead of grid for reliable sticky positioning
-        self.diff_back_btn = tk.Button(frame, text="⬅ Back", font=("Comic Sans MS", 12, "bold"),
-                                  bg="#FFAB91", fg="white", bd=0, 
-                                  command=lambda: (self.play_click_sound(), self.reset_quiz(), self.name_screen()))
+        self.diff_back_btn = tk.Button(self.difficulty_frame, text="⬅ Back", font=self.get_font("Comic Sans MS", 12, "bold"),
+                                  bg="#FFAB91", bd=0, 
+                                  command=self._on_return_clicked)
         self.diff_back_btn.place(x=20, y=20)
 
-        self.diff_greeting = tk.Label(content_frame, text=f"Hi {self.user_name}! 👋", font=("Comic Sans MS", 22, "bold"), bg="#FFF4E0")
+        self.diff_greeting = ttk.Label(content_frame, text="", style="Greeting.TLabel")
         self.diff_greeting.grid(row=0, column=0, pady=10)
         
-        self.diff_title = tk.Label(content_frame, text="Choose your difficulty level:", font=("Comic Sans MS", 16), bg="#FFF4E0")
+        self.diff_title = ttk.Label(content_frame, text="Choose your difficulty level:", style="Subtitle.TLabel")
         self.diff_title.grid(row=1, column=0, pady=10)
 
         self.diff_buttons = []
         colors = {"easy": "#8BC34A", "medium": "#FFC107", "hard": "#F44336"}
         for i, level in enumerate(["easy", "medium", "hard"]):
-            btn = tk.Button(content_frame, text=level.capitalize(), font=("Comic Sans MS", 14, "bold"),
-                             bg=colors[level], fg="white", width=15,
+            btn = tk.Button(content_frame, text=level.capitalize(), font=self.get_font("Comic Sans MS", 14, "bold"),
+                             bg=colors[level], width=15,
                              command=lambda lvl=level: self.start_quiz(lvl))
             btn.grid(row=i+2, column=0, pady=10)
             self.diff_buttons.append(btn)
+
+    def go_to_difficulty(self):
+        """Displays the screen for selecting quiz difficulty."""
+        
+        # Check if we are coming from the name screen or back from the quiz
+        if self._screen == "name":
+            name = self.name_entry.get().strip()
+            if not name:
+                messagebox.showwarning("Input Error", "Please enter your name.")
+                return
+            self.user_name = name
+        
+        self.play_click_sound() # Play click sound
+        self.diff_greeting.config(text=f"Hi {self.user_name}! 👋")
             
-        self.update_ui_scaling()
+        self._show_screen("difficulty", self.difficulty_frame)
 
     def start_quiz(self, difficulty):
         """Initializes the quiz data for the selected difficulty."""
@@ -439,7 +688,7 @@ class QuizApp:
         
         # Reset state variables related to quiz content
         self.selected_level = difficulty.capitalize()
-        quiz_data_for_level = quiz_levels.get(difficulty, [])
+        quiz_data_for_level = get_level_questions(difficulty)
         
         if not quiz_data_for_level:
             messagebox.showerror("Error", f"No quiz data found for {difficulty} level.")
@@ -452,13 +701,16 @@ class QuizApp:
             self.name_screen()
             return
         
-        # Limit to 10 questions for a quick game
-        self.quiz_data = self.quiz_data[:10]
+        # Pick up to 10 random questions (in random order) from the whole level.
+        # Each question gets its own options list so shuffling below never
+        # mutates the cached data shared with later quizzes.
+        chosen = random.sample(self.quiz_data, min(10, len(self.quiz_data)))
+        self.quiz_data = [dict(q, options=list(q["options"])) for q in chosen]
         
-        # Randomize questions and options
-        random.shuffle(self.quiz_data)
+        # Randomize options
+        shuffle = random.shuffle
         for q in self.quiz_data:
-            random.shuffle(q["options"])
+            shuffle(q["options"])
         
         self.q_index = 0
         self.score = 0
@@ -466,83 +718,98 @@ class QuizApp:
         
         self.quiz_screen()
 
-    def quiz_screen(self):
-        """Sets up the main quiz question screen."""
-        self.clear_screen()
-        frame = tk.Frame(self.root, bg="#FFF4E0")
-        frame.grid(row=0, column=0, sticky="nsew")
+    def _build_quiz_screen_once(self):
+        """Builds the quiz screen widgets once; quiz_screen only resets them for a new quiz."""
+        self.quiz_frame = tk.Frame(self.root)
+        self._persistent_frames.append(self.quiz_frame)
 
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_rowconfigure(1, weight=0)
-        frame.grid_rowconfigure(2, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
+        self.quiz_frame.grid_rowconfigure(0, weight=1)
+        self.quiz_frame.grid_rowconfigure(1, weight=0)
+        self.quiz_frame.grid_rowconfigure(2, weight=1)
+        self.quiz_frame.grid_columnconfigure(0, weight=1)
         
-        content_frame = tk.Frame(frame, bg="#FFF4E0")
+        content_frame = tk.Frame(self.quiz_frame)
         content_frame.grid(row=1, column=0)
 
         # Change Difficulty Button - Using PLACE for overlay positioning
         self.quiz_back_btn = tk.Button(
-            frame, text="⬅ Change Level", font=("Comic Sans MS", 10, "bold"),
-            bg="#FFAB91", fg="white", bd=0,
-            command=lambda: (self.play_click_sound(), self.reset_quiz(), self.go_to_difficulty())
+            self.quiz_frame, text="⬅ Change Level", font=self.get_font("Comic Sans MS", 10, "bold"),
+            bg="#FFAB91", bd=0,
+            command=self._on_change_level_clicked
         )
         self.quiz_back_btn.place(x=20, y=50) # Initial place, updated in scaling
 
         # Progress bar
         content_frame.grid_columnconfigure(0, weight=1)
-        self.progress = ttk.Progressbar(content_frame, length=600, maximum=len(self.quiz_data))
+        self.progress = ttk.Progressbar(content_frame, length=600)
         self.progress.grid(row=0, column=0, pady=(15, 10), padx=10)
 
         # Cat Icon Frame
-        cat_frame = tk.Frame(content_frame, bg="#FFF4E0")
+        cat_frame = tk.Frame(content_frame)
         cat_frame.grid(row=1, column=0, pady=(5, 5))
 
         # Cat Image Label
-        self.cat_icon = tk.Label(cat_frame, bg="#FFF4E0")
+        self.cat_icon = tk.Label(cat_frame)
         self.cat_icon.pack()
 
         # Hearts
-        self.hearts_frame = tk.Frame(content_frame, bg="#FFF4E0")
+        self.hearts_frame = tk.Frame(content_frame)
         self.hearts_frame.grid(row=2, column=0, pady=(5, 10))
 
-        # Hearts will be updated with images on first display/scaling
-        self.update_hearts()
+        # One label shows the whole row; update_hearts repaints its composite image
+        self.hearts_label = tk.Label(self.hearts_frame)
+        self.hearts_label.pack(pady=2)
 
-        self.question_label = tk.Label(content_frame, text="", font=("Comic Sans MS", 13), wraplength=700, justify="left", bg="#FFF4E0", anchor="w")
+        self.question_label = ttk.Label(content_frame, text="", style="Question.TLabel", wraplength=700, justify="left", anchor="w")
         self.question_label.grid(row=3, column=0, pady=10, padx=60, sticky="ew")
 
         self.var = tk.StringVar()
         self.var.set(None)
 
-        options_container = tk.Frame(content_frame, bg="#FFF4E0")
+        options_container = tk.Frame(content_frame)
         options_container.grid(row=4, column=0, sticky="ew", padx=60, pady=5)
         options_container.grid_columnconfigure(0, weight=1)
 
-        self.option_buttons = []
-        self.option_frames = []
+        self._last_selected_index = None # Index of the currently highlighted option
 
-        for i in range(4):
-            option_frame = tk.Frame(options_container, bg="#FFF4E0", bd=1, relief="solid")
+        self.option_frames = [tk.Frame(options_container, bd=1, relief="solid") for _ in range(4)]
+        self.option_buttons = [tk.Radiobutton(option_frame, text="", variable=self.var, value="", font=self.get_font("Comic Sans MS", 14), anchor="w", padx=10, pady=5)
+                               for option_frame in self.option_frames]
+
+        for i, (option_frame, rb) in enumerate(zip(self.option_frames, self.option_buttons)):
             option_frame.grid(row=i, column=0, sticky="ew", pady=4)
-            self.option_frames.append(option_frame)
-            
-            rb = tk.Radiobutton(option_frame, text="", variable=self.var, value="", font=("Comic Sans MS", 14), bg="#FFF4E0", anchor="w", padx=10, pady=5, command=self.on_option_select)
             rb.pack(fill="x", expand=True)
-            self.option_buttons.append(rb)
 
-        self.feedback_label = tk.Label(content_frame, text="", font=("Comic Sans MS", 14, "bold"), bg="#FFF4E0")
+        # A single trace on the shared variable replaces per-button commands
+        self.var.trace_add("write", lambda *_: self.on_option_select())
+
+        self.feedback_label = ttk.Label(content_frame, text="", style="Feedback.TLabel")
         self.feedback_label.grid(row=5, column=0, pady=5)
 
-        self.hint_btn = tk.Button(content_frame, text="Show Hint 💡", font=("Comic Sans MS", 12, "bold"),
-                                     bg="#FF9800", fg="white", width=12, command=self.show_hint)
+        self.hint_btn = tk.Button(content_frame, text="Show Hint 💡", font=self.get_font("Comic Sans MS", 12, "bold"),
+                                     bg="#FF9800", width=12, command=self.show_hint)
         self.hint_btn.grid(row=6, column=0, pady=(0, 10))
 
-        self.next_btn = tk.Button(content_frame, text="Next 🐾", font=("Comic Sans MS", 14, "bold"),
-                                     bg="#FF7BA9", fg="white", width=15, command=self.check_answer)
+        # The Next button flips between two actions on every question. Register
+        # each as a Tcl command once and swap the names, since passing a Python
+        # callable to config() registers a fresh command that lives until the
+        # button is destroyed.
+        self._check_cmd = self.root.register(self.check_answer)
+        self._next_cmd = self.root.register(self.next_question)
+        self.next_btn = tk.Button(content_frame, text="Next 🐾", font=self.get_font("Comic Sans MS", 14, "bold"),
+                                     bg="#FF7BA9", width=15, command=self._check_cmd)
         self.next_btn.grid(row=7, column=0, pady=(0, 15))
 
+    def quiz_screen(self):
+        """Sets up the main quiz question screen."""
+        # Reset per-quiz widget state (the widgets are reused across quizzes)
+        self.progress.config(maximum=len(self.quiz_data))
+        self.next_btn.config(text="Next 🐾", command=self._check_cmd)
+
         self.display_question()
-        self.update_ui_scaling()
+
+        # Rescaling also redraws the hearts for the fresh set of lives
+        self._show_screen("quiz", self.quiz_frame)
 
     def display_question(self):
         """Populates the screen with the current question and options."""
@@ -569,17 +836,34 @@ class QuizApp:
         default_bg = "#FFF4E0"
         selected_bg = "#FFDDC1"
 
+        # var.set(None) (new question) also fires the trace; treat it as no selection
+        if selected_value == "None":
+            selected_value = ""
+
         if not reset and selected_value:
              self.play_click_sound() # Play click sound on selection
 
-        for i, rb in enumerate(self.option_buttons):
-            frame = self.option_frames[i]
-            if not reset and rb['value'] == selected_value:
-                frame.config(bg=selected_bg, relief="groove", bd=2)
-                rb.config(bg=selected_bg)
-            else:
-                frame.config(bg=default_bg, relief="solid", bd=1)
-                rb.config(bg=default_bg)
+        # Find the newly selected index from the question data (no Tcl lookups)
+        new_index = None
+        if not reset:
+            options = self.quiz_data[self.q_index]["options"]
+            if selected_value in options:
+                new_index = options.index(selected_value)
+
+        # Only the previous and the new selection change color
+        last_index = self._last_selected_index
+        if new_index == last_index:
+            return
+
+        if last_index is not None:
+            self.option_frames[last_index].config(bg=default_bg, relief="solid", bd=1)
+            self.option_buttons[last_index].config(bg=default_bg)
+
+        if new_index is not None:
+            self.option_frames[new_index].config(bg=selected_bg, relief="groove", bd=2)
+            self.option_buttons[new_index].config(bg=selected_bg)
+
+        self._last_selected_index = new_index
 
     def show_hint(self):
         """Displays a hint for the current question."""
@@ -602,14 +886,14 @@ class QuizApp:
                 self.correct_sound.play()
 
             self.score += 1
-            self.feedback_label.config(text="✅ Correct!", fg="green")
+            self.feedback_label.config(text="✅ Correct!", foreground="green")
             self.set_cat_icon_image('excited') # Set to Excited Cat Image
         else:
             # Play wrong sound (non-blocking)
             if self.wrong_sound:
                 self.wrong_sound.play()
 
-            self.feedback_label.config(text=f"❌ Incorrect! Correct: {correct}", fg="red")
+            self.feedback_label.config(text=f"❌ Incorrect! Correct: {correct}", foreground="red")
             self.set_cat_icon_image('sad') # Set to Sad Cat Image
             self.lose_life()
 
@@ -618,7 +902,7 @@ class QuizApp:
             rb.config(state="disabled")
         self.hint_btn.config(state="disabled")
         # Change next button command to the continue action
-        self.next_btn.config(text="Continue ➡️", command=self.next_question)
+        self.next_btn.config(text="Continue ➡️", command=self._next_cmd)
 
     def lose_life(self):
         """Decrements life count and checks for game over condition."""
@@ -635,99 +919,118 @@ class QuizApp:
         self.q_index += 1
         if self.q_index < len(self.quiz_data):
             self.display_question()
-            self.next_btn.config(text="Next 🐾", command=self.check_answer)
+            self.next_btn.config(text="Next 🐾", command=self._check_cmd)
         else:
             self.show_final_score()
 
+    def _on_return_clicked(self):
+        """Returns to the name screen with a fresh quiz state."""
+        self.play_click_sound()
+        self.reset_quiz()
+        self.name_screen()
+
+    def _on_change_level_clicked(self):
+        """Abandons the current quiz and returns to the difficulty screen."""
+        self.play_click_sound()
+        self.reset_quiz()
+        self.go_to_difficulty()
+
     def retry_same_level(self):
         self.play_click_sound()
         difficulty_key = self.selected_level.lower()
         self.start_quiz(difficulty_key)
 
-    def game_over(self):
-        """Displays the game over screen."""
-        self.clear_screen()
-        frame = tk.Frame(self.root, bg="#FFF4E0")
-        frame.grid(row=0, column=0, sticky="nsew")
+    def _build_game_over_screen_once(self):
+        """Builds the game over screen widgets once; game_over only refreshes them."""
+        self.game_over_frame = tk.Frame(self.root)
+        self._persistent_frames.append(self.game_over_frame)
         
         # Centering
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
-        content = tk.Frame(frame, bg="#FFF4E0")
+        self.game_over_frame.grid_rowconfigure(0, weight=1)
+        self.game_over_frame.grid_columnconfigure(0, weight=1)
+        content = tk.Frame(self.game_over_frame)
         content.grid(row=0, column=0)
 
-        self.go_title = tk.Label(content, text="💔 Game Over 💔", font=("Comic Sans MS", 30, "bold"), bg="#FFF4E0")
+        self.go_title = ttk.Label(content, text="💔 Game Over 💔", style="GameOver.TLabel")
         self.go_title.pack(pady=40)
         
-        self.go_msg = tk.Label(content, text=f"You ran out of lives, {self.user_name}!", 
-              font=("Comic Sans MS", 18), bg="#FFF4E0")
+        self.go_msg = ttk.Label(content, text="", style="Message.TLabel")
         self.go_msg.pack(pady=10)
 
         # Updated command to play click sound before switching screen
         self.go_btn = tk.Button(content, text="Return to Menu", 
-              font=("Comic Sans MS", 16, "bold"), bg="#FF7BA9", fg="white",
-              command=lambda: (self.play_click_sound(), self.reset_quiz(), self.name_screen()))
+              font=self.get_font("Comic Sans MS", 16, "bold"), bg="#FF7BA9",
+              command=self._on_return_clicked)
         self.go_btn.pack(pady=30)
+
+    def game_over(self):
+        """Displays the game over screen."""
+        self.go_msg.config(text=f"You ran out of lives, {self.user_name}!")
         
-        self.update_ui_scaling()
+        self._show_screen("game_over", self.game_over_frame)
 
-    def show_final_score(self):
-        """Displays the final score and quiz result message."""
-        self.save_result_to_csv()
-        self.clear_screen()
-        frame = tk.Frame(self.root, bg="#FFF4E0")
-        frame.grid(row=0, column=0, sticky="nsew")
+    def _build_score_screen_once(self):
+        """Builds the score screen widgets once; show_final_score only updates their text."""
+        self.score_frame = tk.Frame(self.root)
+        self._persistent_frames.append(self.score_frame)
 
-        frame.grid_rowconfigure(0, weight=1)
-        frame.grid_rowconfigure(1, weight=0)
-        frame.grid_rowconfigure(2, weight=1)
-        frame.grid_columnconfigure(0, weight=1)
+        self.score_frame.grid_rowconfigure(0, weight=1)
+        self.score_frame.grid_rowconfigure(1, weight=0)
+        self.score_frame.grid_rowconfigure(2, weight=1)
+        self.score_frame.grid_columnconfigure(0, weight=1)
 
-        content_frame = tk.Frame(frame, bg="#FFF4E0")
+        content_frame = tk.Frame(self.score_frame)
         content_frame.grid(row=1, column=0, pady=20)
 
-        # Calculate message based on performance
-        total_questions = len(self.quiz_data)
-        ratio = self.score / total_questions if total_questions > 0 else 0
-        
-        if ratio == 1:
-            msg = "🌟 Excellent! Perfect score!"
-        elif ratio >= 0.7:
-            msg = "🎉 Great job! You did well!"
-        elif ratio >= 0.4:
-            msg = "👍 Good effort! Keep practicing!"
-        else:
-            msg = "💪 Needs improvement. Try again!"
-
-        self.score_title = tk.Label(content_frame, text=f"{self.user_name}, you finished the {self.selected_level} quiz!", font=("Comic Sans MS", 24, "bold"), bg="#FFF4E0")
+        self.score_title = ttk.Label(content_frame, text="", style="Title.TLabel")
         self.score_title.grid(row=0, column=0, pady=20)
         
-        self.score_val = tk.Label(content_frame, text=f"Your Score: {self.score}/{total_questions}", font=("Comic Sans MS", 18), bg="#FFF4E0")
+        self.score_val = ttk.Label(content_frame, text="", style="Message.TLabel")
         self.score_val.grid(row=1, column=0, pady=10)
         
-        self.score_msg = tk.Label(content_frame, text=msg, font=("Comic Sans MS", 16), bg="#FFF4E0")
+        self.score_msg_var = tk.StringVar()
+        self.score_msg = ttk.Label(content_frame, textvariable=self.score_msg_var, style="Subtitle.TLabel")
         self.score_msg.grid(row=2, column=0, pady=10)
-        button_frame = tk.Frame(content_frame, bg="#FFF4E0")
+        button_frame = tk.Frame(content_frame)
         button_frame.grid(row=3, column=0, pady=20)
 
         # Return Button
         self.score_btn = tk.Button(
-            button_frame, text="Return ↩️", font=("Comic Sans MS", 14, "bold"),
-            bg="#FF7BA9", fg="white", width=15, 
-            command=lambda: (self.play_click_sound(), self.reset_quiz(), self.name_screen())
+            button_frame, text="Return ↩️", font=self.get_font("Comic Sans MS", 14, "bold"),
+            bg="#FF7BA9", width=15, 
+            command=self._on_return_clicked
         )
         self.score_btn.pack(side="left", padx=10)
         # -----------------------------
 
         # Try Again button (LEFT)
         self.retry_btn = tk.Button(
-            button_frame, text="Try Again 🔁", font=("Comic Sans MS", 14, "bold"),
-            bg="#8BC34A", fg="white", width=15, command=self.retry_same_level
+            button_frame, text="Try Again 🔁", font=self.get_font("Comic Sans MS", 14, "bold"),
+            bg="#8BC34A", width=15, command=self.retry_same_level
         )
         self.retry_btn.pack(side="left", padx=10)
+
+    def show_final_score(self):
+        """Displays the final score and quiz result message."""
+        self.save_result_to_csv()
+        # Calculate message based on performance
+        total_questions = len(self.quiz_data)
+        ratio = self.score / total_questions if total_questions > 0 else 0
         
-        self.update_ui_scaling()
+        if ratio == 1:
+            msg = "🌟 Excellent! Perfect score!"
+        elif ratio >= 0.7:
+            msg = "🎉 Great job! You did well!"
+        elif ratio >= 0.4:
+            msg = "👍 Good effort! Keep practicing!"
+        else:
+            msg = "💪 Needs improvement. Try again!"
+
+        self.score_title.config(text=f"{self.user_name}, you finished the {self.selected_level} quiz!")
+        self.score_val.config(text=f"Your Score: {self.score}/{total_questions}")
+        self.score_msg_var.set(msg)
 
+        self._show_screen("score", self.score_frame)
 
 # Run App
 if __name__ == "__main__":